@@ -1,8 +1,5 @@
-import requests
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 import os
+import sys
 import json
 from datetime import datetime
 import random
@@ -14,6 +11,7 @@ anniversary = datetime(datetime.now().year, 11, 2)
 
 def fetch_cat_fact():
     try:
+        import requests
         fact_resp = requests.get("https://meowfacts.herokuapp.com/", timeout=5)
         fact = fact_resp.json()['data'][0]
 
@@ -37,7 +35,7 @@ def fetch_cat_fact():
             <p class="error-text">Failed to fetch cat fact or image: {e}</p>
         </div>"""
 
-def fetch_quote():
+def fetch_quote(consume=True):
     try:
         with open('quotes.txt', 'r', encoding='utf-8') as file:
             quotes = file.readlines()
@@ -46,9 +44,10 @@ def fetch_quote():
                 <h2 class="section-title">💬 Quote</h2>
                 <p class="quote-text">No more quotes left in quotes.txt.</p>
             </div>"""
-        # Save back without the first line
-        with open("quotes.txt", "w", encoding='utf-8') as file:
-            file.writelines(quotes[1:])
+        # Save back without the first line, unless this is only a preview
+        if consume:
+            with open("quotes.txt", "w", encoding='utf-8') as file:
+                file.writelines(quotes[1:])
         return f"""
         <div class="section-card quote-section">
             <h2 class="section-title">💬 Quote of the Day</h2>
@@ -64,8 +63,11 @@ def fetch_quote():
             <p class="error-text">Failed to fetch quote: {e}</p>
         </div>"""
 
-def fetch_affirmation():
+def fetch_affirmation(offline=False):
+    if offline:
+        return "You are amazing and capable!"
     try:
+        import requests
         r = requests.get("https://www.affirmations.dev/", timeout=5)
         return r.json().get("affirmation", "You are amazing and capable!")
     except Exception:
@@ -73,6 +75,7 @@ def fetch_affirmation():
 
 def fetch_fun_fact():
     try:
+        import requests
         r = requests.get("https://uselessfacts.jsph.pl/api/v2/facts/random?language=en", timeout=5)
         return f"""
         <div class="section-card fun-fact-section">
@@ -91,6 +94,7 @@ def fetch_fun_fact():
 
 def fetch_joke():
     try:
+        import requests
         r = requests.get("https://official-joke-api.appspot.com/random_joke", timeout=5)
         joke = r.json()
         setup = joke['setup']
@@ -139,11 +143,17 @@ def fetch_joke():
             <p class="error-text">Failed to load joke or explanation. Error: {e}</p>
         </div>"""
 
-def fetch_tarot_card():
+def fetch_tarot_card(index=None):
+    # index lets personalize.render_tarot_sections() pass a precomputed draw
     try:
-        random.seed(datetime.now().strftime("%Y%m%d"))
+        import requests
         cards = json.loads(open("tarot_cards/tarot.json", "r", encoding="utf-8").read())
-        card = cards["cards"][random.randint(0, len(cards["cards"]) - 1)]
+        if index is None:
+            random.seed(datetime.now().strftime("%Y%m%d"))
+            index = random.randint(0, len(cards["cards"]) - 1)
+        if not 0 <= index < len(cards["cards"]):
+            raise IndexError(f"tarot index {index} out of range for {len(cards['cards'])} cards")
+        card = cards["cards"][index]
         name = card["name"]
         meaning = card["meaning_up"]
         desc = card.get("desc", "")
@@ -549,7 +559,9 @@ def get_styles():
     </style>
     """
 
-def run():
+def run(offline=False):
+    # offline skips every section that needs the network, so a render-only
+    # preview never imports requests, and leaves quotes.txt untouched
     today = datetime.now()
     days_together = (today - start_date).days
     days_until = max((anniversary - today).days, 0)
@@ -568,7 +580,7 @@ def run():
             <h1 class="main-title">🌟 Daily Delight 🌟</h1>
             
             <div class="affirmation-section">
-                <h2 class="affirmation-text">🌈 {fetch_affirmation()}</h2>
+                <h2 class="affirmation-text">🌈 {fetch_affirmation(offline)}</h2>
             </div>
             
             <div class="love-journey">
@@ -579,16 +591,20 @@ def run():
                 </div>
             </div>
             
-            {fetch_cat_fact()}
-            {fetch_joke()}
-            {fetch_fun_fact()}
-            {fetch_quote()}
+            {'' if offline else fetch_cat_fact()}
+            {'' if offline else fetch_joke()}
+            {'' if offline else fetch_fun_fact()}
+            {fetch_quote(consume=not offline)}
         </div>
     </body>
     </html>
     """
 
 def send_email(content_html):
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+
     sender = os.getenv("SENDER_EMAIL")
     password = os.getenv("SENDER_PASSWORD")
     recipient = os.getenv("DELIGHT_EMAIL")
@@ -607,12 +623,16 @@ def send_email(content_html):
         s.login(sender, password)
         s.send_message(msg)
 
-def demo():
-    content = run()
+def demo(offline=False):
+    content = run(offline)
     with open("index.html", "w", encoding="utf-8") as f:
         f.write(content)
 
 if __name__ == "__main__":
+    # python main.py --render-only: write index.html without touching the network
+    if "--render-only" in sys.argv:
+        demo(offline=True)
+        sys.exit(0)
     content = run()
     send_email(content)
     demo()
\ No newline at end of file
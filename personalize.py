@@ -0,0 +1,126 @@
+import json
+from datetime import date
+
+import numpy as np
+
+TAROT_JSON = "tarot_cards/tarot.json"
+
+MASK64 = (1 << 64) - 1
+GOLDEN = 0x9E3779B97F4A7C15
+MIX1 = 0xBF58476D1CE4E5B9
+MIX2 = 0x94D049BB133111EB
+EPOCH = date(1970, 1, 1)
+
+def tarot_deck_size(path=TAROT_JSON):
+    with open(path, "r", encoding="utf-8") as f:
+        return len(json.load(f)["cards"])
+
+def anniversary_in_year(anniversaries, years):
+    # Place each anniversary's month and day in the given year (datetime64[Y]).
+    # Feb 29 overflows into Mar 1 in a non-leap year.
+    month = anniversaries.astype("datetime64[M]")
+    month_offset = month - anniversaries.astype("datetime64[Y]").astype("datetime64[M]")
+    day_offset = anniversaries - month.astype("datetime64[D]")
+    return (years.astype("datetime64[M]") + month_offset).astype("datetime64[D]") + day_offset
+
+def personalize(start_dates, anniversaries, ids=None, today=None, deck_size=None):
+    if deck_size is None:
+        deck_size = tarot_deck_size()
+    start_dates = np.asarray(start_dates, dtype="datetime64[D]")
+    anniversaries = np.asarray(anniversaries, dtype="datetime64[D]")
+    if ids is None:
+        ids = np.arange(len(start_dates))
+    ids = np.asarray(ids)
+    if not np.issubdtype(ids.dtype, np.integer) or (ids < 0).any():
+        raise ValueError("recipient ids must be non-negative integers, e.g. row numbers rather than email addresses")
+    ids = ids.astype(np.uint64)
+    today = np.datetime64(today if today is not None else "today", "D")
+
+    days_together = (today - start_dates).astype(np.int64)
+
+    # Count down to the next anniversary, rolling into next year once this
+    # year's has passed
+    year = today.astype("datetime64[Y]")
+    upcoming = anniversary_in_year(anniversaries, year)
+    passed = upcoming < today
+    upcoming[passed] = anniversary_in_year(anniversaries[passed], year + 1)
+    days_until = (upcoming - today).astype(np.int64)
+
+    # splitmix64 over (recipient id, day): same card all day, different per recipient
+    with np.errstate(over="ignore"):
+        x = ids * np.uint64(GOLDEN) ^ np.uint64(today.astype(np.int64))
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(MIX1)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(MIX2)
+        x = x ^ (x >> np.uint64(31))
+    tarot_index = (x % np.uint64(deck_size)).astype(np.int64)
+
+    return {
+        "days_together": days_together,
+        "days_until": days_until,
+        "tarot_index": tarot_index,
+    }
+
+def anniversary_in_year_reference(anniv, year):
+    try:
+        return anniv.replace(year=year)
+    except ValueError:
+        return date(year, 3, 1)
+
+def personalize_reference(start_dates, anniversaries, ids, today, deck_size):
+    # Plain datetime loop computing the same three outputs as personalize()
+    day = (today - EPOCH).days
+    days_together, days_until, tarot_index = [], [], []
+    for start, anniv, i in zip(start_dates, anniversaries, ids):
+        days_together.append((today - start).days)
+
+        upcoming = anniversary_in_year_reference(anniv, today.year)
+        if upcoming < today:
+            upcoming = anniversary_in_year_reference(anniv, today.year + 1)
+        days_until.append((upcoming - today).days)
+
+        x = ((i * GOLDEN) & MASK64) ^ day
+        x = ((x ^ (x >> 30)) * MIX1) & MASK64
+        x = ((x ^ (x >> 27)) * MIX2) & MASK64
+        x ^= x >> 31
+        tarot_index.append(x % deck_size)
+
+    return {
+        "days_together": days_together,
+        "days_until": days_until,
+        "tarot_index": tarot_index,
+    }
+
+def render_tarot_sections(tarot_index, fetch_tarot_card):
+    # Each distinct card is rendered (and its guidance fetched) once, then
+    # shared by every recipient who drew it. fetch_tarot_card is passed in,
+    # e.g. main.fetch_tarot_card, so this module does not import the script.
+    cards, inverse = np.unique(np.asarray(tarot_index), return_inverse=True)
+    sections = [fetch_tarot_card(int(i)) for i in cards]
+    return [sections[j] for j in inverse]
+
+if __name__ == "__main__":
+    import time
+
+    n = 100_000
+    rng = np.random.default_rng(0)
+    base = np.datetime64("2000-01-01", "D")
+    start_dates = base + rng.integers(0, 9000, n).astype("timedelta64[D]")
+    anniversaries = base + rng.integers(0, 9000, n).astype("timedelta64[D]")
+    ids = np.arange(n)
+    today = date.today()
+    deck_size = tarot_deck_size()
+
+    t0 = time.perf_counter()
+    result = personalize(start_dates, anniversaries, ids, today, deck_size)
+    t1 = time.perf_counter()
+    print(f"personalize: {n} recipients in {(t1 - t0) * 1000:.1f} ms")
+
+    start_objs = start_dates.astype(object)
+    anniv_objs = anniversaries.astype(object)
+    t0 = time.perf_counter()
+    reference = personalize_reference(start_objs, anniv_objs, ids.tolist(), today, deck_size)
+    t1 = time.perf_counter()
+    print(f"python loop: {n} recipients in {(t1 - t0) * 1000:.1f} ms")
+
+    for key in result:
+        assert result[key].tolist() == reference[key], key
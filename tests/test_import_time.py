@@ -0,0 +1,25 @@
+import os
+import shutil
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+NETWORK_MODULES = ("requests", "smtplib", "email.mime")
+
+def test_render_only_imports_no_network_modules(tmp_path):
+    # Run the real entry point in a copy, so index.html and quotes.txt in the
+    # repo are left alone
+    shutil.copy(os.path.join(ROOT, "main.py"), tmp_path)
+    shutil.copy(os.path.join(ROOT, "quotes.txt"), tmp_path)
+    shutil.copytree(os.path.join(ROOT, "tarot_cards"), tmp_path / "tarot_cards")
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "main.py", "--render-only"],
+        cwd=tmp_path, capture_output=True, text=True, check=True,
+    )
+    assert (tmp_path / "index.html").exists()
+
+    imported = [line.rsplit("|", 1)[-1].strip() for line in proc.stderr.splitlines() if "|" in line]
+    offenders = [m for m in imported if m.startswith(NETWORK_MODULES)]
+    assert offenders == []
@@ -0,0 +1,103 @@
+import os
+import sys
+import types
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from personalize import personalize, personalize_reference, tarot_deck_size
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DECK_SIZE = tarot_deck_size(os.path.join(ROOT, "tarot_cards", "tarot.json"))
+
+def check(start_dates, anniversaries, today):
+    ids = list(range(len(start_dates)))
+    result = personalize(start_dates, anniversaries, ids, today, DECK_SIZE)
+    reference = personalize_reference(start_dates, anniversaries, ids, today, DECK_SIZE)
+    for key in result:
+        assert result[key].tolist() == reference[key], key
+    return result
+
+def test_anniversary_boundaries():
+    anniv = date(2019, 11, 2)
+    start = date(2021, 11, 2)
+    for today, expected in [
+        (date(2026, 11, 1), 1),   # day before
+        (date(2026, 11, 2), 0),   # on the day
+        (date(2026, 11, 3), 364), # day after, rolls to 2027-11-02
+        (date(2026, 1, 1), 305),
+    ]:
+        result = check([start], [anniv], today)
+        assert result["days_until"].tolist() == [expected]
+        assert result["days_together"].tolist() == [(today - start).days]
+
+def test_anniversary_earlier_in_year_counts_to_next_year():
+    result = check([date(2021, 11, 2)], [date(2021, 1, 5)], date(2026, 10, 19))
+    assert result["days_until"].tolist() == [(date(2027, 1, 5) - date(2026, 10, 19)).days]
+
+def test_feb_29_anniversary():
+    anniv = date(2020, 2, 29)
+    start = date(2020, 2, 29)
+    # Leap year: the anniversary stays on Feb 29
+    assert check([start], [anniv], date(2024, 2, 28))["days_until"].tolist() == [1]
+    assert check([start], [anniv], date(2024, 2, 29))["days_until"].tolist() == [0]
+    # Non-leap year: it falls on Mar 1
+    assert check([start], [anniv], date(2026, 2, 28))["days_until"].tolist() == [1]
+    assert check([start], [anniv], date(2026, 3, 1))["days_until"].tolist() == [0]
+    # Once Mar 1 has passed, count down to next year's date: Mar 1, 2027
+    assert check([start], [anniv], date(2026, 3, 2))["days_until"].tolist() == [(date(2027, 3, 1) - date(2026, 3, 2)).days]
+    # ...or Feb 29 when next year is a leap year
+    assert check([start], [anniv], date(2027, 3, 2))["days_until"].tolist() == [(date(2028, 2, 29) - date(2027, 3, 2)).days]
+
+def test_matches_reference_on_random_table():
+    rng = np.random.default_rng(1)
+    base = date(2000, 1, 1)
+    start_dates = [base + timedelta(days=int(d)) for d in rng.integers(0, 9000, 2000)]
+    anniversaries = [base + timedelta(days=int(d)) for d in rng.integers(0, 9000, 2000)]
+    for today in (date(2024, 2, 29), date(2026, 10, 19), date(2027, 12, 31)):
+        check(start_dates, anniversaries, today)
+
+def test_rejects_non_integer_or_negative_ids():
+    dates = [date(2021, 11, 2)] * 2
+    for ids in (["a@example.com", "b@example.com"], [1, -1], [1.0, 2.0]):
+        with pytest.raises(ValueError):
+            personalize(dates, dates, ids, date(2026, 10, 19), DECK_SIZE)
+
+def test_tarot_index_range_determinism_and_spread():
+    n = 100_000
+    dates = [date(2021, 11, 2)] * n
+    today = date(2026, 10, 19)
+    first = personalize(dates, dates, None, today, DECK_SIZE)["tarot_index"]
+    again = personalize(dates, dates, None, today, DECK_SIZE)["tarot_index"]
+    tomorrow = personalize(dates, dates, None, today + timedelta(days=1), DECK_SIZE)["tarot_index"]
+
+    assert first.min() >= 0 and first.max() < DECK_SIZE
+    assert (first == again).all()
+    assert (first != tomorrow).mean() > 0.9
+    counts = np.bincount(first, minlength=DECK_SIZE)
+    assert counts.min() > 0.8 * n / DECK_SIZE
+    assert counts.max() < 1.2 * n / DECK_SIZE
+
+def test_render_tarot_sections_fetches_each_card_once():
+    from personalize import render_tarot_sections
+
+    calls = []
+    def fake_fetch(index):
+        calls.append(index)
+        return f"card {index}"
+
+    assert render_tarot_sections([5, 3, 5, 77], fake_fetch) == ["card 5", "card 3", "card 5", "card 77"]
+    assert sorted(calls) == [3, 5, 77]
+
+def test_fetch_tarot_card_rejects_out_of_range_index(monkeypatch):
+    import main
+
+    monkeypatch.chdir(ROOT)
+    # The range check fails before any request is made; a bare module keeps
+    # the test independent of requests being installed
+    monkeypatch.setitem(sys.modules, "requests", sys.modules.get("requests") or types.ModuleType("requests"))
+    for index in (-1, DECK_SIZE):
+        html = main.fetch_tarot_card(index)
+        assert "error-section" in html
+        assert "out of range" in html